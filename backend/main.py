@@ -1,163 +1,204 @@
-from flask import Flask, request, jsonify
-from collections import defaultdict
+from flask import Flask, Response, request, jsonify
+from collections import defaultdict, deque
+from functools import lru_cache
 from flask_cors import CORS
+import orjson
+import sys
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "https://clr-parser-seven.vercel.app", "allow_headers": "*"}})
 
 def parse_grammar(input_strings):
     productions = []
+    seen = set()
     for s in input_strings:
         lhs, rhs_str = s.split(" -> ")
-        rhs = rhs_str.split()
-        productions.append((lhs, rhs))
+        lhs = sys.intern(lhs)
+        rhs = [sys.intern(symbol) for symbol in rhs_str.split()]
+        key = (lhs, tuple(rhs))
+        if key not in seen:
+            seen.add(key)
+            productions.append((lhs, rhs))
     return productions
 
 def augment_grammar(productions):
     start_symbol = productions[0][0]
-    augmented = [("S'", [start_symbol])] + productions
+    augmented = [(sys.intern("S'"), [start_symbol])] + productions
     return augmented
 
+# FIRST sets are int bitmasks over terminal_order; nullable holds the non-terminals that derive epsilon
 def compute_first(productions, non_terminals, terminals):
-    first = {symbol: set() for symbol in non_terminals.union(terminals)}
-    for t in terminals:
-        first[t].add(t)
+    terminal_order = sorted(terminals)
+    first = dict.fromkeys(non_terminals, 0)
+    first.update((t, 1 << i) for i, t in enumerate(terminal_order))
+    nullable = set()
     changed = True
     while changed:
         changed = False
         for lhs, rhs in productions:
-            first_set = set()
+            first_set = 0
             for symbol in rhs:
-                first_set.update(first[symbol] - {""})
-                if "" not in first[symbol]:
+                first_set |= first[symbol]
+                if symbol not in nullable:
                     break
             else:
-                first_set.add("")
-            if not first_set.issubset(first[lhs]):
-                first[lhs].update(first_set)
+                if lhs not in nullable:
+                    nullable.add(lhs)
+                    changed = True
+            if first_set & ~first[lhs]:
+                first[lhs] |= first_set
                 changed = True
-    return first
+    return first, nullable, terminal_order
 
-def closure(items, productions, first, non_terminals):
+# suffix_first[prod_index][dot_pos] is (FIRST of rhs[dot_pos:], whether that suffix is nullable)
+def compute_suffix_first(productions, first, nullable, terminal_order):
+    decoded = {}
+    suffix_first = []
+    for lhs, rhs in productions:
+        firsts = 0
+        beta_nullable = True
+        row = [(firsts, beta_nullable)]
+        for symbol in reversed(rhs):
+            if symbol in nullable:
+                firsts |= first[symbol]
+            else:
+                firsts = first[symbol]
+                beta_nullable = False
+            row.append((firsts, beta_nullable))
+        row.reverse()
+        for i, (mask, beta_nullable) in enumerate(row):
+            if mask not in decoded:
+                decoded[mask] = frozenset(t for j, t in enumerate(terminal_order) if mask >> j & 1)
+            row[i] = (decoded[mask], beta_nullable)
+        suffix_first.append(row)
+    return suffix_first
+
+def closure(items, productions, prods_by_lhs, suffix_first, non_terminals):
     I = set(items)
-    changed = True
-    while changed:
-        changed = False
-        new_items = set()
-        for prod_index, dot_pos, lookahead in I:
-            lhs, rhs = productions[prod_index]
-            if dot_pos < len(rhs) and rhs[dot_pos] in non_terminals:
-                next_symbol = rhs[dot_pos]
-                beta = rhs[dot_pos + 1:]
-                first_beta = set()
-                for sym in beta:
-                    first_beta.update(first[sym] - {""})
-                    if "" not in first[sym]:
-                        break
-                else:
-                    first_beta.add(lookahead)
-                for j, (nt, rule_rhs) in enumerate(productions):
-                    if nt == next_symbol:
-                        for la in first_beta:
-                            new_item = (j, 0, la)
-                            if new_item not in I:
-                                new_items.add(new_item)
-                                changed = True
-        I.update(new_items)
+    work = deque(items)
+    while work:
+        prod_index, dot_pos, lookahead = work.popleft()
+        rhs = productions[prod_index][1]
+        if dot_pos >= len(rhs) or rhs[dot_pos] not in non_terminals:
+            continue
+        first_beta, beta_nullable = suffix_first[prod_index][dot_pos + 1]
+        if beta_nullable:
+            first_beta = first_beta | {lookahead}
+        for j in prods_by_lhs[rhs[dot_pos]]:
+            for la in first_beta:
+                new_item = (j, 0, la)
+                if new_item not in I:
+                    I.add(new_item)
+                    work.append(new_item)
     return I
 
-def goto(items, symbol, productions, first, non_terminals):
-    J = set()
-    for prod_index, dot_pos, lookahead in items:
-        lhs, rhs = productions[prod_index]
-        if dot_pos < len(rhs) and rhs[dot_pos] == symbol:
-            new_item = (prod_index, dot_pos + 1, lookahead)
-            J.add(new_item)
-    return closure(J, productions, first, non_terminals)
-
-def build_dfa(productions, first, non_terminals):
+def build_dfa(productions, prods_by_lhs, suffix_first, non_terminals):
     initial_item = (0, 0, "$")
-    I0 = closure({initial_item}, productions, first, non_terminals)
+    I0 = frozenset(closure({initial_item}, productions, prods_by_lhs, suffix_first, non_terminals))
     states = [I0]
-    state_dict = {frozenset(I0): 0}
+    state_dict = {I0: 0}
+    kernel_dict = {}
     transitions = {}
-    to_process = [0]
+    to_process = deque([0])
     while to_process:
-        current = to_process.pop(0)
+        current = to_process.popleft()
         current_state = states[current]
-        symbols = non_terminals.union({t for _, rhs in productions for t in rhs})
-        for symbol in symbols:
-            next_state = goto(current_state, symbol, productions, first, non_terminals)
-            if next_state:
-                fs = frozenset(next_state)
-                if fs not in state_dict:
+        kernels = defaultdict(set)
+        for prod_index, dot_pos, lookahead in current_state:
+            rhs = productions[prod_index][1]
+            if dot_pos < len(rhs):
+                kernels[rhs[dot_pos]].add((prod_index, dot_pos + 1, lookahead))
+        for symbol in sorted(kernels):
+            kernel = frozenset(kernels[symbol])
+            state_index = kernel_dict.get(kernel)
+            if state_index is None:
+                next_state = frozenset(closure(kernel, productions, prods_by_lhs, suffix_first, non_terminals))
+                state_index = state_dict.get(next_state)
+                if state_index is None:
                     state_index = len(states)
                     states.append(next_state)
-                    state_dict[fs] = state_index
+                    state_dict[next_state] = state_index
                     to_process.append(state_index)
-                else:
-                    state_index = state_dict[fs]
-                transitions[(current, symbol)] = state_index
+                kernel_dict[kernel] = state_index
+            transitions[(current, symbol)] = state_index
     return states, transitions
 
+def add_action(action, conflicts, key, entry):
+    existing = action.get(key)
+    if existing is None:
+        action[key] = entry
+    elif existing != entry:
+        # Keep every competing action so shift/reduce and reduce/reduce conflicts can be shown
+        conflicts.setdefault(key, [existing]).append(entry)
+
 def build_parsing_table(states, transitions, productions, non_terminals):
-    action = defaultdict(list)  # Changed to list to store multiple actions
+    action = {}
+    conflicts = {}
     goto = {}
-    terminals = {t for _, rhs in productions for t in rhs if t not in non_terminals}.union({"$"})
     
+    # Process shifts and goto transitions
+    for (i, symbol), j in transitions.items():
+        if symbol in non_terminals:
+            goto[(i, symbol)] = j
+        else:
+            action[(i, symbol)] = ("shift", j)
+    
+    # Process reduces and accept
     for i, state in enumerate(states):
-        # Process shifts first
-        for t in terminals:
-            if (i, t) in transitions:
-                action[(i, t)].append(("shift", transitions[(i, t)]))
-        
-        # Process reduces and accept
         for prod_index, dot_pos, lookahead in state:
-            lhs, rhs = productions[prod_index]
-            if dot_pos == len(rhs):
+            if dot_pos == len(productions[prod_index][1]):
                 if prod_index == 0 and lookahead == "$":
-                    action[(i, "$")].append("accept")
+                    add_action(action, conflicts, (i, "$"), "accept")
                 else:
-                    action[(i, lookahead)].append(("reduce", prod_index))
-        
-        # Process goto transitions
-        for nt in non_terminals:
-            if (i, nt) in transitions:
-                goto[(i, nt)] = transitions[(i, nt)]
+                    add_action(action, conflicts, (i, lookahead), ("reduce", prod_index))
     
-    return action, goto
+    return action, goto, conflicts
 
-def format_production(prod_index, dot_pos, productions):
-    lhs, rhs = productions[prod_index]
-    rhs_with_dot = rhs[:dot_pos] + ['.'] + rhs[dot_pos:]
-    return f"{lhs} -> {' '.join(rhs_with_dot)}"
+def format_productions(productions):
+    # Dotted form of every production at every dot position
+    return [[f"{lhs} -> {' '.join(rhs[:dot_pos] + ['.'] + rhs[dot_pos:])}" for dot_pos in range(len(rhs) + 1)]
+            for lhs, rhs in productions]
 
 def compute_clr_parser(input_grammar):
     productions = parse_grammar(input_grammar)
     productions = augment_grammar(productions)
-    non_terminals = {lhs for lhs, _ in productions}
-    terminals = {t for _, rhs in productions for t in rhs if t not in non_terminals}
-    first = compute_first(productions, non_terminals, terminals)
-    states, transitions = build_dfa(productions, first, non_terminals)
-    action, goto = build_parsing_table(states, transitions, productions, non_terminals)
-    return action, goto, states, productions, terminals
+    non_terminals = frozenset(lhs for lhs, _ in productions)
+    terminals = frozenset(t for _, rhs in productions for t in rhs if t not in non_terminals)
+    prods_by_lhs = defaultdict(list)
+    for i, (lhs, _) in enumerate(productions):
+        prods_by_lhs[lhs].append(i)
+    first, nullable, terminal_order = compute_first(productions, non_terminals, terminals)
+    suffix_first = compute_suffix_first(productions, first, nullable, terminal_order)
+    states, transitions = build_dfa(productions, prods_by_lhs, suffix_first, non_terminals)
+    action, goto, conflicts = build_parsing_table(states, transitions, productions, non_terminals)
+    return action, goto, conflicts, states, productions, terminals
+
+def format_states(states, productions):
+    dotted = format_productions(productions)
+    return [[{
+        'production': dotted[prod_index][dot_pos],
+        'lookahead': lookahead
+    } for prod_index, dot_pos, lookahead in sorted(state)] for state in states]
 
-def make_json_serializable(obj, productions=None):
-    if isinstance(obj, set):
-        if productions and all(isinstance(item, tuple) and len(item) == 3 for item in obj):
-            # Format states with productions
-            return [{
-                'production': format_production(item[0], item[1], productions),
-                'lookahead': item[2]
-            } for item in sorted(obj)]
-        return sorted(list(obj))
-    elif isinstance(obj, dict):
-        return {str(k): make_json_serializable(v, productions) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [make_json_serializable(item, productions) for item in obj]
-    elif isinstance(obj, tuple):
-        return [make_json_serializable(item, productions) for item in obj]
-    return obj
+@lru_cache(maxsize=256)
+def build_parse_response(grammar):
+    action, goto, conflicts, states, productions, terminals = compute_clr_parser(grammar)
+    
+    # Format action table for all terminals in same row
+    row_terminals = terminals | {"$"}
+    formatted_action = {}
+    for (state, symbol), entry in action.items():
+        if str(state) not in formatted_action:
+            formatted_action[str(state)] = {t: [] for t in row_terminals}
+        formatted_action[str(state)][symbol] = conflicts.get((state, symbol), [entry])
+    
+    response = {
+        'action': formatted_action,
+        'goto': {str(k): v for k, v in goto.items()},
+        'states': format_states(states, productions),
+        'productions': [f"{lhs} -> {' '.join(rhs)}" for lhs, rhs in productions]
+    }
+    return orjson.dumps(response, option=orjson.OPT_SORT_KEYS)
 
 @app.route('/parse', methods=['POST'])
 def parse_grammar_route():
@@ -166,24 +207,10 @@ def parse_grammar_route():
         grammar = data.get('grammar', '').strip().split('\n')
         if not grammar or all(not rule.strip() for rule in grammar):
             return jsonify({'error': 'No grammar rules provided'}), 400
-        grammar = [rule.strip() for rule in grammar if rule.strip()]
-        
-        action, goto, states, productions, terminals = compute_clr_parser(grammar)
-        
-        # Format action table for all terminals in same row
-        formatted_action = {}
-        for (state, symbol), actions in action.items():
-            if str(state) not in formatted_action:
-                formatted_action[str(state)] = {t: [] for t in terminals.union({"$"})}
-            formatted_action[str(state)][symbol] = actions
+        # Normalize whitespace so equivalent submissions share a cache entry
+        grammar = tuple(" ".join(rule.split()) for rule in grammar if rule.strip())
         
-        response = {
-            'action': make_json_serializable(formatted_action),
-            'goto': make_json_serializable(goto),
-            'states': make_json_serializable(states, productions),
-            'productions': [f"{lhs} -> {' '.join(rhs)}" for lhs, rhs in productions]
-        }
-        return jsonify(response)
+        return Response(build_parse_response(grammar), mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -1,11 +1,18 @@
-from collections import defaultdict
+import sys
+from array import array
+from collections import defaultdict, deque
 
 def parse_grammar(input_strings):
     productions = []
+    seen = set()
     for s in input_strings:
         lhs, rhs_str = s.split(" -> ")
-        rhs = rhs_str.split()
-        productions.append((lhs, rhs))
+        lhs = sys.intern(lhs)
+        rhs = [sys.intern(symbol) for symbol in rhs_str.split()]
+        key = (lhs, tuple(rhs))
+        if key not in seen:
+            seen.add(key)
+            productions.append((lhs, rhs))
     return productions
 
 def augment_grammar(productions):
@@ -14,172 +21,401 @@ def augment_grammar(productions):
     return augmented
 
 def get_symbols(productions):
-    non_terminals = set(lhs for lhs, rhs in productions)
-    all_symbols = set(symbol for lhs, rhs in productions for symbol in rhs)
-    terminals = all_symbols - non_terminals
-    terminals.add("$")
+    non_terminals = frozenset(lhs for lhs, rhs in productions)
+    all_symbols = frozenset(symbol for lhs, rhs in productions for symbol in rhs)
+    terminals = (all_symbols - non_terminals) | {"$"}
     return non_terminals, terminals
 
-def compute_nullable(productions, non_terminals):
-    nullable = {nt: False for nt in non_terminals}
-    changed = True
-    while changed:
-        changed = False
-        for lhs, rhs in productions:
-            if not rhs or all(symbol in non_terminals and nullable[symbol] for symbol in rhs):
-                if not nullable[lhs]:
-                    nullable[lhs] = True
-                    changed = True
+def compute_nullable(productions, uses_of):
+    remaining = [len(rhs) for lhs, rhs in productions]
+    worklist = deque(lhs for lhs, rhs in productions if not rhs)
+    nullable = 0
+    while worklist:
+        nt = worklist.popleft()
+        if nullable >> nt & 1:
+            continue
+        nullable |= 1 << nt
+        for prod_index in uses_of[nt]:
+            remaining[prod_index] -= 1
+            if not remaining[prod_index]:
+                worklist.append(productions[prod_index][0])
     return nullable
 
-def compute_first(productions, non_terminals, terminals, nullable):
-    first = {symbol: set() for symbol in non_terminals.union(terminals)}
+# FIRST sets are bitmasks over the ids of terminal symbols; epsilon is tracked by the nullable mask
+def compute_first(productions, terminals, nullable, n_symbols, uses_of):
+    first = [0] * n_symbols
     for t in terminals:
-        first[t].add(t)
-    changed = True
-    while changed:
-        changed = False
-        for lhs, rhs in productions:
+        first[t] = 1 << t
+    pending = range(len(productions))
+    while pending:
+        dirty = set()
+        for prod_index in pending:
+            lhs, rhs = productions[prod_index]
+            old = first[lhs]
+            new = old
             for symbol in rhs:
-                first[lhs].update(first[symbol] - {""})
-                if symbol not in nullable:
+                new |= first[symbol]
+                if not nullable >> symbol & 1:
                     break
-            if all(s in nullable for s in rhs):
-                first[lhs].add("")
+            if new != old:
+                first[lhs] = new
+                dirty.add(lhs)
+        pending = {prod_index for nt in dirty for prod_index in uses_of[nt]}
     return first
 
-def closure(items, productions, first, nullable, terminals, non_terminals):
-    I = set(items)
-    changed = True
-    while changed:
-        changed = False
-        new_items = set()
-        for prod_index, dot_position, lookahead in I:
-            prod = productions[prod_index]
-            rhs = prod[1]
-            if dot_position < len(rhs):
-                symbol = rhs[dot_position]
-                if symbol in non_terminals:
-                    for b_prod_index, (b_lhs, b_rhs) in enumerate(productions):
-                        if b_lhs == symbol:
-                            beta = rhs[dot_position + 1:]
-                            b_set = first_of_sequence(beta, lookahead, first, nullable, terminals, non_terminals)
-                            for b in b_set:
-                                new_item = (b_prod_index, 0, b)
-                                if new_item not in I:
-                                    new_items.add(new_item)
-                                    changed = True
-        I.update(new_items)
+def bits(mask):
+    result = []
+    while mask:
+        low = mask & -mask
+        result.append(low.bit_length() - 1)
+        mask ^= low
+    return result
+
+# Item cores are packed into one int: prod_index * stride + dot_position, where
+# stride is one more than the longest RHS. An LR(1) state maps each core to a
+# bitmask of its lookahead symbol ids.
+def intern_symbols(productions, non_terminals, terminals):
+    symbols = sorted(terminals | non_terminals)
+    symbol_id = {sym: i for i, sym in enumerate(symbols)}
+    int_productions = [(symbol_id[lhs], tuple(symbol_id[s] for s in rhs)) for lhs, rhs in productions]
+    stride = max(len(rhs) for lhs, rhs in productions) + 1
+    return symbols, symbol_id, int_productions, stride
+
+# Symbol right after the dot for every item core, or -1 when the dot is at the end
+def compute_dot_symbols(productions, stride):
+    dot_symbol = array("i", [-1]) * (len(productions) * stride)
+    for prod_index, (lhs, rhs) in enumerate(productions):
+        base = prod_index * stride
+        for dot_position, symbol in enumerate(rhs):
+            dot_symbol[base + dot_position] = symbol
+    return dot_symbol
+
+def closure(kernel, dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride):
+    I = dict(kernel)
+    # Only items whose lookaheads grew need to be expanded again
+    work = [core for core in kernel if dot_symbol[core] in non_terminals]
+    while work:
+        core = work.pop()
+        symbol = dot_symbol[core]
+        firsts, beta_nullable = suffix_first[core + 1]
+        if beta_nullable:
+            firsts |= I[core]
+        for b_prod_index in prods_by_lhs[symbol]:
+            b_core = b_prod_index * stride
+            old = I.get(b_core, 0)
+            if old | firsts != old:
+                I[b_core] = old | firsts
+                if dot_symbol[b_core] in non_terminals:
+                    work.append(b_core)
     return I
 
-def first_of_sequence(sequence, lookahead, first, nullable, terminals, non_terminals):
-    result = set()
-    for symbol in sequence:
-        result.update(first[symbol] - {""})
-        if symbol not in nullable:
-            return result
-    result.add(lookahead)
-    return result
+# Indexed by item core: (FIRST mask of the suffix after the dot, whether that suffix is nullable)
+def compute_suffix_first(productions, first, nullable, stride):
+    suffix_first = [None] * (len(productions) * stride)
+    for prod_index, (lhs, rhs) in enumerate(productions):
+        core = prod_index * stride + len(rhs)
+        firsts = 0
+        beta_nullable = True
+        suffix_first[core] = (firsts, beta_nullable)
+        for symbol in reversed(rhs):
+            core -= 1
+            if nullable >> symbol & 1:
+                firsts |= first[symbol]
+            else:
+                firsts = first[symbol]
+                beta_nullable = False
+            suffix_first[core] = (firsts, beta_nullable)
+    return suffix_first
+
+def intern_state(items, key, states, state_dict, to_process):
+    state_index = state_dict.get(key)
+    if state_index is None:
+        state_index = len(states)
+        states.append(items)
+        state_dict[key] = state_index
+        to_process.append(state_index)
+    return state_index
 
-def goto(items, symbol, productions, first, nullable, terminals, non_terminals):
-    J = set()
-    for prod_index, dot_position, lookahead in items:
-        prod = productions[prod_index]
-        rhs = prod[1]
-        if dot_position < len(rhs) and rhs[dot_position] == symbol:
-            new_item = (prod_index, dot_position + 1, lookahead)
-            J.add(new_item)
-    return closure(J, productions, first, nullable, terminals, non_terminals)
-
-def build_dfa(productions, first, nullable, terminals, non_terminals):
-    initial_item = (0, 0, "$")
-    I0 = closure({initial_item}, productions, first, nullable, terminals, non_terminals)
-    states = [I0]
-    state_dict = {frozenset(I0): 0}
-    transitions = {}
-    to_process = [0]
+def build_dfa(dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride, end_marker):
+    states = []
+    state_dict = {}
+    kernel_dict = {}
+    state_edges = []
+    state_completions = []
+    to_process = deque()
+    I0 = closure({0: 1 << end_marker}, dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride)  # [S' -> . S, $]
+    intern_state(I0, frozenset(I0.items()), states, state_dict, to_process)
     
     while to_process:
-        current = to_process.pop(0)
-        current_state = states[current]
-        for symbol in terminals.union(non_terminals):
-            next_state = goto(current_state, symbol, productions, first, nullable, terminals, non_terminals)
-            if next_state:
-                fs = frozenset(next_state)
-                if fs not in state_dict:
-                    state_index = len(states)
-                    states.append(next_state)
-                    state_dict[fs] = state_index
-                    to_process.append(state_index)
-                else:
-                    state_index = state_dict[fs]
-                transitions[(current, symbol)] = state_index
-    return states, transitions
+        current = to_process.popleft()
+        kernels = defaultdict(dict)
+        completions = []
+        for core, lookaheads in states[current].items():
+            symbol = dot_symbol[core]
+            if symbol >= 0:
+                kernels[symbol][core + 1] = lookaheads
+            else:
+                completions.extend((core // stride, lookahead) for lookahead in bits(lookaheads))
+        edges = []
+        for symbol in sorted(kernels):
+            kernel = kernels[symbol]
+            kernel_key = frozenset(kernel.items())
+            state_index = kernel_dict.get(kernel_key)
+            if state_index is None:
+                next_state = closure(kernel, dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride)
+                state_index = intern_state(next_state, frozenset(next_state.items()), states, state_dict, to_process)
+                kernel_dict[kernel_key] = state_index
+            edges.append((symbol, state_index))
+        state_edges.append(edges)
+        state_completions.append(completions)
+    return states, state_edges, state_completions
 
-def build_parsing_table(states, transitions, productions, terminals, non_terminals):
+def build_parsing_table(state_edges, state_completions, symbols, terminals):
     action = {}
     goto = {}
     
-    for i, state in enumerate(states):
-        for t in terminals:
-            if (i, t) in transitions:
-                action[(i, t)] = ("shift", transitions[(i, t)])
-        
-        for prod_index, dot_position, lookahead in state:
-            prod = productions[prod_index]
-            rhs = prod[1]
-            if dot_position == len(rhs):
-                if prod_index == 0:
-                    action[(i, "$")] = ("accept", None)
-                else:
-                    action[(i, lookahead)] = ("reduce", prod_index)
+    for i, edges in enumerate(state_edges):
+        for symbol, target in edges:
+            if symbol in terminals:
+                action[(i, symbols[symbol])] = ("shift", target)
+            else:
+                goto[(i, symbols[symbol])] = target
         
-        for nt in non_terminals:
-            if (i, nt) in transitions:
-                goto[(i, nt)] = transitions[(i, nt)]
+        for prod_index, lookahead in state_completions[i]:
+            if prod_index == 0:
+                action[(i, "$")] = ("accept", None)
+            else:
+                action[(i, symbols[lookahead])] = ("reduce", prod_index)
     
     return action, goto
 
-def compute_clr_parser(input_grammar):
+def closure_lr0(cores, dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride):
+    I = set(cores)
+    work = list(cores)
+    while work:
+        core = work.pop()
+        symbol = dot_symbol[core]
+        # Like closure(), don't expand through a suffix that derives no terminal string:
+        # those items could only ever carry an empty lookahead set
+        if symbol in non_terminals and suffix_first[core + 1] != (0, False):
+            for b_prod_index in prods_by_lhs[symbol]:
+                b_core = b_prod_index * stride
+                if b_core not in I:
+                    I.add(b_core)
+                    work.append(b_core)
+    return I
+
+def build_lr0_dfa(dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride):
+    states = []
+    state_dict = {}
+    state_goto = []
+    to_process = deque()
+    I0 = closure_lr0({0}, dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride)
+    intern_state(I0, frozenset(I0), states, state_dict, to_process)
+    
+    while to_process:
+        current = to_process.popleft()
+        kernels = defaultdict(set)
+        for core in states[current]:
+            symbol = dot_symbol[core]
+            if symbol >= 0:
+                kernels[symbol].add(core + 1)
+        goto_row = {}
+        for symbol in sorted(kernels):
+            next_state = closure_lr0(kernels[symbol], dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride)
+            goto_row[symbol] = intern_state(next_state, frozenset(next_state), states, state_dict, to_process)
+        state_goto.append(goto_row)
+    return states, state_goto
+
+# Tarjan-style SCC traversal from DeRemer & Pennello: values[x] |= values[y] for every y reachable from x
+def digraph(relation, values):
+    infinity = len(relation) + 1
+    depth = [0] * len(relation)
+    stack = []
+    for root in range(len(relation)):
+        if depth[root]:
+            continue
+        stack.append(root)
+        depth[root] = len(stack)
+        work = [(root, len(stack), iter(relation[root]))]
+        while work:
+            x, d, targets = work[-1]
+            for y in targets:
+                if not depth[y]:
+                    stack.append(y)
+                    depth[y] = len(stack)
+                    work.append((y, len(stack), iter(relation[y])))
+                    break
+                depth[x] = min(depth[x], depth[y])
+                values[x] |= values[y]
+            else:
+                work.pop()
+                if depth[x] == d:
+                    while True:
+                        top = stack.pop()
+                        depth[top] = infinity
+                        values[top] = values[x]
+                        if top == x:
+                            break
+                if work:
+                    parent = work[-1][0]
+                    depth[parent] = min(depth[parent], depth[x])
+                    values[parent] |= values[x]
+    return values
+
+def compute_lalr_lookaheads(states, state_goto, productions, prods_by_lhs, suffix_first, terminals, non_terminals, nullable, stride, end_marker):
+    nt_transitions = []
+    nt_index = {}
+    for p, goto_row in enumerate(state_goto):
+        for symbol in goto_row:
+            if symbol in non_terminals:
+                nt_index[(p, symbol)] = len(nt_transitions)
+                nt_transitions.append((p, symbol))
+    
+    start_symbol = productions[0][1][0]
+    direct_reads = []
+    reads = []
+    for p, A in nt_transitions:
+        r = state_goto[p][A]
+        dr = 0
+        r_reads = []
+        for symbol, target in state_goto[r].items():
+            if symbol in terminals:
+                dr |= 1 << symbol
+            elif nullable >> symbol & 1:
+                r_reads.append(nt_index[(r, symbol)])
+        if p == 0 and A == start_symbol:
+            dr |= 1 << end_marker
+        direct_reads.append(dr)
+        reads.append(r_reads)
+    read = digraph(reads, direct_reads)
+    
+    includes = [[] for _ in nt_transitions]
+    lookback = defaultdict(list)
+    for i, (p, B) in enumerate(nt_transitions):
+        for prod_index in prods_by_lhs[B]:
+            core = prod_index * stride
+            if core not in states[p]:
+                continue
+            state = p
+            for symbol in productions[prod_index][1]:
+                lookback[(state, core)].append(i)
+                core += 1
+                if symbol in non_terminals and suffix_first[core][1]:
+                    includes[nt_index[(state, symbol)]].append(i)
+                state = state_goto[state][symbol]
+            lookback[(state, core)].append(i)
+    follow = digraph(includes, read)
+    
+    lookaheads = []
+    for s, state in enumerate(states):
+        state_lookaheads = {}
+        for core in state:
+            la = 1 << end_marker if core < stride else 0
+            for i in lookback[(s, core)]:
+                la |= follow[i]
+            state_lookaheads[core] = la
+        lookaheads.append(state_lookaheads)
+    return lookaheads
+
+def build_lalr_dfa(productions, dot_symbol, prods_by_lhs, suffix_first, terminals, non_terminals, nullable, stride, end_marker):
+    lr0_states, state_goto = build_lr0_dfa(dot_symbol, prods_by_lhs, suffix_first, non_terminals, stride)
+    states = compute_lalr_lookaheads(lr0_states, state_goto, productions, prods_by_lhs, suffix_first, terminals, non_terminals, nullable, stride, end_marker)
+    state_edges = [sorted(goto_row.items()) for goto_row in state_goto]
+    state_completions = []
+    for state in states:
+        state_completions.append([(core // stride, lookahead) for core, la in state.items() if dot_symbol[core] < 0 for lookahead in bits(la)])
+    return states, state_edges, state_completions
+
+def decode_state(state, symbols, stride):
+    return [divmod(core, stride) + (symbols[lookahead],) for core in sorted(state) for lookahead in bits(state[core])]
+
+def compute_clr_parser(input_grammar, mode="clr"):
     productions = parse_grammar(input_grammar)
     productions = augment_grammar(productions)
     non_terminals, terminals = get_symbols(productions)
-    nullable = compute_nullable(productions, non_terminals)
-    first = compute_first(productions, non_terminals, terminals, nullable)
-    states, transitions = build_dfa(productions, first, nullable, terminals, non_terminals)
-    action, goto = build_parsing_table(states, transitions, productions, terminals, non_terminals)
-    return action, goto, productions, states
+    symbols, symbol_id, int_productions, stride = intern_symbols(productions, non_terminals, terminals)
+    int_terminals = frozenset(symbol_id[t] for t in terminals)
+    int_non_terminals = frozenset(symbol_id[nt] for nt in non_terminals)
+    prods_by_lhs = defaultdict(list)
+    uses_of = defaultdict(list)
+    for i, (lhs, rhs) in enumerate(int_productions):
+        prods_by_lhs[lhs].append(i)
+        for symbol in rhs:
+            uses_of[symbol].append(i)
+    nullable = compute_nullable(int_productions, uses_of)
+    first = compute_first(int_productions, int_terminals, nullable, len(symbols), uses_of)
+    suffix_first = compute_suffix_first(int_productions, first, nullable, stride)
+    dot_symbol = compute_dot_symbols(int_productions, stride)
+    if mode == "clr":
+        states, state_edges, state_completions = build_dfa(dot_symbol, prods_by_lhs, suffix_first, int_non_terminals, stride, symbol_id["$"])
+    elif mode == "lalr":
+        states, state_edges, state_completions = build_lalr_dfa(int_productions, dot_symbol, prods_by_lhs, suffix_first, int_terminals, int_non_terminals, nullable, stride, symbol_id["$"])
+    else:
+        raise ValueError("Unknown parser mode: {0}".format(mode))
+    action, goto = build_parsing_table(state_edges, state_completions, symbols, int_terminals)
+    states = [decode_state(state, symbols, stride) for state in states]
+    tables = compile_parse_tables(action, goto)
+    return action, goto, productions, states, non_terminals, terminals, tables
+
+# Dense per-state rows for parse_input: action_rows[state][terminal_id] and goto_rows[state][non_terminal_id].
+# The extra last action column stays empty and catches tokens the grammar does not know.
+def compile_parse_tables(action, goto):
+    terminal_id = {t: i for i, t in enumerate(sorted({t for _, t in action}))}
+    non_terminal_id = {nt: i for i, nt in enumerate(sorted({nt for _, nt in goto}))}
+    states_count = max(max(action.keys(), default=(-1, ""))[0], max(goto.keys(), default=(-1, ""))[0]) + 1
+    action_rows = [[None] * (len(terminal_id) + 1) for _ in range(states_count)]
+    goto_rows = [[None] * len(non_terminal_id) for _ in range(states_count)]
+    for (state, t), entry in action.items():
+        action_rows[state][terminal_id[t]] = entry
+    for (state, nt), target in goto.items():
+        goto_rows[state][non_terminal_id[nt]] = target
+    return terminal_id, non_terminal_id, action_rows, goto_rows
 
-def parse_input(action, goto, productions, input_string):
+def parse_input(tables, productions, input_string):
+    terminal_id, non_terminal_id, action_rows, goto_rows = tables
     input_tokens = input_string.split() + ["$"]
+    unknown = len(terminal_id)
+    token_ids = [terminal_id.get(token, unknown) for token in input_tokens]
+    # Remaining input only changes on shifts, so reduce steps reuse the last rendered tail
+    tail_index = -1
     stack = [0]
+    # stack_strs[k] is the rendered stack up to stack[k], kept in lockstep with stack
+    stack_strs = ["0"]
     steps = []
     index = 0
     
     while True:
         state = stack[-1]
         token = input_tokens[index]
-        step = {"Step": len(steps) + 1, "Stack": " ".join(map(str, stack)), "Input": " ".join(input_tokens[index:])}
+        if tail_index != index:
+            tail_index = index
+            input_tail = " ".join(input_tokens[index:])
+        step = {"Step": len(steps) + 1, "Stack": stack_strs[-1], "Input": input_tail}
+        entry = action_rows[state][token_ids[index]]
         
-        if (state, token) not in action:
+        if entry is None:
             step["Action"] = "Error: No action for state {0} and token {1}".format(state, token)
             steps.append(step)
             break
         
-        action_type, value = action[(state, token)]
+        action_type, value = entry
         
         if action_type == "shift":
             step["Action"] = "Shift"
             stack.append(value)
+            stack_strs.append("{0} {1}".format(stack_strs[-1], value))
             index += 1
         elif action_type == "reduce":
             prod_index = value
             lhs, rhs = productions[prod_index]
             step["Action"] = "Reduce ({0} -> {1})".format(lhs, " ".join(rhs))
-            for _ in range(len(rhs)):
-                stack.pop()
+            if rhs:
+                del stack[-len(rhs):]
+                del stack_strs[-len(rhs):]
             current_state = stack[-1]
-            stack.append(goto[(current_state, lhs)])
+            stack.append(goto_rows[current_state][non_terminal_id[lhs]])
+            stack_strs.append("{0} {1}".format(stack_strs[-1], stack[-1]))
         elif action_type == "accept":
             step["Action"] = "Accept"
             steps.append(step)
@@ -189,20 +425,17 @@ def parse_input(action, goto, productions, input_string):
     
     return steps
 
-def print_states_table(states, productions):
-    print("\nCLR(1) States:")
+def print_states_table(states, productions, title="CLR(1)"):
+    print("\n{0} States:".format(title))
     print("| State | Items                                      |")
     print("|-------|--------------------------------------------|")
+    dotted = [[" ".join(rhs[:d] + ["."] + rhs[d:]) for d in range(len(rhs) + 1)] for _, rhs in productions]
     for i, state in enumerate(states):
-        items_str = ", ".join(["[{0} -> {1}, {2}]".format(
-            productions[p][0],
-            " ".join(productions[p][1][:d] + ["."] + productions[p][1][d:] if d < len(productions[p][1]) else productions[p][1] + ["."]),
-            l
-        ) for p, d, l in state])
+        items_str = ", ".join(["[{0} -> {1}, {2}]".format(productions[p][0], dotted[p][d], l) for p, d, l in state])
         print("| I{0:<4} | {1:<42} |".format(i, items_str))
 
-def print_parsing_table(action, goto, terminals, non_terminals):
-    print("\nCLR(1) Parsing Table:")
+def print_parsing_table(action, goto, terminals, non_terminals, title="CLR(1)"):
+    print("\n{0} Parsing Table:".format(title))
     header = "| State | " + " | ".join(["Action: {0:<2}".format(t) for t in sorted(terminals)]) + " | " + " | ".join(["Goto: {0:<2}".format(nt) for nt in sorted(non_terminals)]) + " |"
     print(header)
     print("|-------|" + "---|" * (len(terminals) + len(non_terminals)) + "|")
@@ -237,15 +470,16 @@ def print_parse_table(steps):
         print("| {0:<4} | {1:<11} | {2:<7} | {3:<17} |".format(step["Step"], step["Stack"], step["Input"], step["Action"]))
 
 if __name__ == "__main__":
+    # python parser.py [clr|lalr]
+    mode = sys.argv[1] if len(sys.argv) > 1 else "clr"
+    title = "LALR(1)" if mode == "lalr" else "CLR(1)"
     grammar = ["S -> C C", "C -> c C", "C -> d"]
-    productions = augment_grammar(parse_grammar(grammar))
-    action, goto, productions, states = compute_clr_parser(grammar)
+    action, goto, productions, states, non_terminals, terminals, tables = compute_clr_parser(grammar, mode)
     
-    print_states_table(states, productions)
-    non_terminals, terminals = get_symbols(productions)
-    print_parsing_table(action, goto, terminals, non_terminals)
+    print_states_table(states, productions, title)
+    print_parsing_table(action, goto, terminals, non_terminals, title)
     
     input_string = "c d d"
-    steps = parse_input(action, goto, productions, input_string)
+    steps = parse_input(tables, productions, input_string)
     print("\nParsing '{0}':".format(input_string))
     print_parse_table(steps)
\ No newline at end of file
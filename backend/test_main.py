@@ -0,0 +1,33 @@
+import unittest
+
+from main import app, build_parse_response
+
+
+class ParseRouteTest(unittest.TestCase):
+    def setUp(self):
+        build_parse_response.cache_clear()
+        self.client = app.test_client()
+
+    def test_shift_reduce_conflict_keeps_both_actions(self):
+        response = self.client.post("/parse", json={"grammar": "E -> E + E\nE -> id"})
+        self.assertEqual(response.status_code, 200)
+        action = response.get_json()["action"]
+        conflicts = [cell for row in action.values() for cell in row.values() if len(cell) > 1]
+        self.assertEqual(conflicts, [[["shift", 3], ["reduce", 1]]])
+        self.assertEqual(action["4"]["+"], [["shift", 3], ["reduce", 1]])
+        self.assertEqual(action["1"]["$"], ["accept"])
+
+    def test_whitespace_variants_share_a_response(self):
+        first = self.client.post("/parse", json={"grammar": "E -> E + E\nE -> id"})
+        second = self.client.post("/parse", json={"grammar": "  E ->  E +   E\n\nE -> id  \n"})
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(build_parse_response.cache_info().hits, 1)
+
+    def test_empty_grammar_is_rejected(self):
+        response = self.client.post("/parse", json={"grammar": "  \n "})
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from parser import compute_clr_parser, parse_grammar, parse_input
+
+
+class ParseGrammarTest(unittest.TestCase):
+    def test_multi_character_terminals_stay_whole(self):
+        productions = parse_grammar(["E -> E == E", "E -> E <= T", "S -> 10 S", "S -> if-stmt"])
+        self.assertEqual(productions, [
+            ("E", ["E", "==", "E"]),
+            ("E", ["E", "<=", "T"]),
+            ("S", ["10", "S"]),
+            ("S", ["if-stmt"]),
+        ])
+
+    def test_duplicate_productions_are_dropped(self):
+        productions = parse_grammar(["S -> C C", "C -> c C", "C -> d", "C -> c C"])
+        self.assertEqual(productions, [("S", ["C", "C"]), ("C", ["c", "C"]), ("C", ["d"])])
+
+
+class ClrTableTest(unittest.TestCase):
+    def test_textbook_grammar(self):
+        action, goto, productions, states = compute_clr_parser(["S -> C C", "C -> c C", "C -> d"])[:4]
+        self.assertEqual(len(states), 10)
+        self.assertEqual(action, {
+            (0, "c"): ("shift", 3), (0, "d"): ("shift", 4),
+            (1, "c"): ("shift", 6), (1, "d"): ("shift", 7),
+            (2, "$"): ("accept", None),
+            (3, "c"): ("shift", 3), (3, "d"): ("shift", 4),
+            (4, "c"): ("reduce", 3), (4, "d"): ("reduce", 3),
+            (5, "$"): ("reduce", 1),
+            (6, "c"): ("shift", 6), (6, "d"): ("shift", 7),
+            (7, "$"): ("reduce", 3),
+            (8, "c"): ("reduce", 2), (8, "d"): ("reduce", 2),
+            (9, "$"): ("reduce", 2),
+        })
+        self.assertEqual(goto, {(0, "C"): 1, (0, "S"): 2, (1, "C"): 5, (3, "C"): 8, (6, "C"): 9})
+
+    def test_nullable_prefix(self):
+        # FIRST(S) has to see through the nullable A to reach b
+        action, goto, productions, states = compute_clr_parser(["S -> A B", "A -> a A", "A -> ", "B -> b"])[:4]
+        self.assertEqual(len(states), 7)
+        self.assertEqual(action, {
+            (0, "a"): ("shift", 3), (0, "b"): ("reduce", 3),
+            (1, "b"): ("shift", 5),
+            (2, "$"): ("accept", None),
+            (3, "a"): ("shift", 3), (3, "b"): ("reduce", 3),
+            (4, "$"): ("reduce", 1),
+            (5, "$"): ("reduce", 4),
+            (6, "b"): ("reduce", 2),
+        })
+        self.assertEqual(goto, {(0, "A"): 1, (0, "S"): 2, (1, "B"): 4, (3, "A"): 6})
+
+
+GRAMMARS = [
+    ["S -> C C", "C -> c C", "C -> d"],
+    ["E -> E + T", "E -> T", "T -> T * F", "T -> F", "F -> ( E )", "F -> id"],
+    ["S -> L = R", "S -> R", "L -> * R", "L -> id", "R -> L"],
+    ["S -> A B c", "A -> a A", "A -> ", "B -> b", "B -> "],
+]
+
+
+def merge_by_core(states):
+    merged = {}
+    for state in states:
+        core = frozenset((p, d) for p, d, la in state)
+        merged.setdefault(core, set()).update(state)
+    return {frozenset(items) for items in merged.values()}
+
+
+class LalrTest(unittest.TestCase):
+    def test_lalr_states_are_clr_states_merged_by_core(self):
+        for grammar in GRAMMARS:
+            with self.subTest(grammar=grammar):
+                clr_states = compute_clr_parser(grammar)[3]
+                lalr_states = compute_clr_parser(grammar, mode="lalr")[3]
+                self.assertEqual({frozenset(state) for state in lalr_states}, merge_by_core(clr_states))
+                self.assertEqual(len(lalr_states), len(merge_by_core(clr_states)))
+
+    def test_lalr_handles_unproductive_non_terminals(self):
+        # B -> B b and S -> S a S S derive no terminal string; LALR must build the same states as CLR anyway
+        for grammar in (["S -> S a S S", "S -> b"], ["S -> a", "S -> B b", "B -> B b"], ["S -> S a S S"]):
+            with self.subTest(grammar=grammar):
+                clr = compute_clr_parser(grammar)
+                lalr = compute_clr_parser(grammar, mode="lalr")
+                self.assertEqual({frozenset(state) for state in lalr[3]}, merge_by_core(clr[3]))
+                for text in ("a", "b", "b a b b", "a b", "b b"):
+                    self.assertEqual(parse_input(lalr[6], lalr[2], text)[-1]["Action"] == "Accept",
+                                     parse_input(clr[6], clr[2], text)[-1]["Action"] == "Accept")
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            compute_clr_parser(["S -> a"], mode="slr")
+
+
+if __name__ == "__main__":
+    unittest.main()